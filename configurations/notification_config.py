@@ -1,11 +1,18 @@
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
-from xml.etree import ElementTree as ET
-import json
+from functools import partial
+from typing import Dict, Any, Optional, List, Tuple, Callable
+from lxml import etree as ET
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Namespaces of the <attr> elements in Torznab feeds and the Newznab feeds they derive from
+ATTR_NAMESPACES = {
+    'torznab': 'http://torznab.com/schemas/2015/feed',
+    'newznab': 'http://www.newznab.com/DTD/2010/feeds/attributes/'
+}
+
 @dataclass
 class NotificationMapping:
     """Configuration for notification field mappings."""
@@ -31,12 +38,24 @@ class NotificationConfig:
     
     def __init__(self, config_path: str = "notification_mapping.json"):
         self.mappings = self._load_mappings(config_path)
+        # Compiled once; the attribute name is bound per call through $name.
+        # Named namespaces avoid testing local-name() on every element of the item.
+        self._attr_xpath = ET.XPath(
+            "torznab:attr[@name=$name]/@value | newznab:attr[@name=$name]/@value",
+            namespaces=ATTR_NAMESPACES,
+            smart_strings=False
+        )
+        # Field extractors are compiled once per mapping and reused for every item
+        self._extractors = {
+            mapping_name: self._compile_mapping(mapping_name, mapping)
+            for mapping_name, mapping in self.mappings.items()
+        }
         
     def _load_mappings(self, config_path: str) -> Dict[str, Dict[str, NotificationMapping]]:
         """Load notification mappings from file."""
         try:
-            with open(config_path, 'r') as f:
-                config_dict = json.load(f)
+            with open(config_path, 'rb') as f:
+                config_dict = orjson.loads(f.read())
                 return {
                     mapping_name: {
                         field: NotificationMapping.from_dict(field_mapping)
@@ -47,10 +66,45 @@ class NotificationConfig:
         except FileNotFoundError:
             logger.error(f"Notification mapping file not found: {config_path}")
             raise
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error(f"Invalid JSON in notification mapping file: {config_path}")
             raise
             
+    def _compile_mapping(
+        self,
+        mapping_name: str,
+        mapping: Dict[str, NotificationMapping]
+    ) -> List[Tuple[str, Callable[[ET.Element], Any]]]:
+        """
+        Compile a mapping into a list of field extractors.
+        
+        Args:
+            mapping_name: The name of the mapping, used for log output
+            mapping: The field mappings to compile
+            
+        Returns:
+            List of (field, extractor) pairs, where each extractor takes an XML item
+        """
+        extractors = []
+        for field, field_mapping in mapping.items():
+            if field_mapping.type == 'static':
+                extractor = partial(self._static_value, value=field_mapping.value)
+            elif field_mapping.type == 'xml_tag':
+                # ETXPath also accepts {namespace}tag paths as used by ElementTree
+                extractor = partial(self._extract_xml_tag, xpath=ET.ETXPath(field_mapping.path))
+            elif field_mapping.type == 'torznab_attr':
+                extractor = partial(self._extract_torznab_attr, attr_name=field_mapping.name, select=field_mapping.select)
+            else:
+                logger.warning(f"Unknown mapping type '{field_mapping.type}' for field '{field}' in {mapping_name}, ignoring")
+                continue
+            extractors.append((field, extractor))
+        return extractors
+        
+    @staticmethod
+    def _static_value(item: ET.Element, value: Optional[str]) -> Optional[str]:
+        """Return a static mapping value regardless of the item."""
+        return value
+        
     def _extract_torznab_attr(self, item: ET.Element, attr_name: str, select: str = 'first') -> Any:
         """
         Extract values of a given torznab:attr name from an XML item.
@@ -63,35 +117,31 @@ class NotificationConfig:
         Returns:
             The selected value(s) from the attribute
         """
-        values = []
-        try:
-            for attr in item.findall(f".//{{*}}attr[@name='{attr_name}']"):
-                values.append(attr.attrib.get("value"))
-        except Exception as e:
-            logger.error(f"Failed to extract torznab attribute '{attr_name}': {e}")
-            
+        values = self._attr_xpath(item, name=attr_name)
         if not values:
             return None
             
         return values[0] if select == 'first' else values
         
-    def _extract_xml_tag(self, item: ET.Element, path: str) -> Optional[str]:
+    def _extract_xml_tag(self, item: ET.Element, xpath: ET.XPath) -> Optional[str]:
         """
         Extract value from an XML tag.
         
         Args:
             item: The XML item element
-            path: The path to the tag
+            xpath: The compiled path to the tag
             
         Returns:
             The text content of the tag if found, None otherwise
         """
-        try:
-            element = item.find(path)
-            return element.text if element is not None else None
-        except Exception as e:
-            logger.error(f"Failed to extract XML tag '{path}': {e}")
+        elements = xpath(item)
+        if not elements:
             return None
+        try:
+            return elements[0].text
+        except AttributeError:
+            # Paths selecting an attribute or text node return plain strings
+            return elements[0]
             
     def get_notification_data(self, item: ET.Element, mapping_name: str) -> Dict[str, Any]:
         """
@@ -107,22 +157,7 @@ class NotificationConfig:
         Raises:
             KeyError: If the specified mapping name doesn't exist
         """
-        if mapping_name not in self.mappings:
+        if mapping_name not in self._extractors:
             raise KeyError(f"Notification mapping '{mapping_name}' not found")
             
-        mapping = self.mappings[mapping_name]
-        data = {}
-        
-        for field, field_mapping in mapping.items():
-            try:
-                if field_mapping.type == 'static':
-                    data[field] = field_mapping.value
-                elif field_mapping.type == 'xml_tag':
-                    data[field] = self._extract_xml_tag(item, field_mapping.path)
-                elif field_mapping.type == 'torznab_attr':
-                    data[field] = self._extract_torznab_attr(item, field_mapping.name, field_mapping.select)
-            except Exception as e:
-                logger.error(f"Failed to extract field '{field}': {e}")
-                data[field] = None
-                
-        return data 
\ No newline at end of file
+        return {field: extractor(item) for field, extractor in self._extractors[mapping_name]}
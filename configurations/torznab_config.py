@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 from typing import Set, Dict
 from pathlib import Path
-import json
+import orjson
 import logging
 
 logger = logging.getLogger(__name__)
@@ -75,13 +75,13 @@ class TorznabConfiguration:
     def from_file(cls, config_path: str = "config.json") -> 'TorznabConfiguration':
         """Create a TorznabConfiguration instance from a configuration file."""
         try:
-            with open(config_path, 'r') as f:
-                config_dict = json.load(f)
+            with open(config_path, 'rb') as f:
+                config_dict = orjson.loads(f.read())
                 return cls.from_dict(config_dict)
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {config_path}")
             raise
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error(f"Invalid JSON in configuration file: {config_path}")
             raise
 
@@ -1,16 +1,20 @@
-import json
+import orjson
 import logging
 import requests
 import argparse
 import sys
+import sched
+import threading
+import copy
 from pathlib import Path
-from typing import Set, Dict, Any, List, Tuple
-from apscheduler.schedulers.background import BackgroundScheduler
-from time import sleep
-from xml.etree import ElementTree as ET
+from typing import Set, Dict, Any, List, Tuple, Optional, Iterator, Iterable
+from time import monotonic
+from functools import lru_cache
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+from lxml import etree as ET
 from notifications import NotifiarrService
 from configurations.torznab_config import TorznabConfiguration, TorznabEndpoint
-from configurations.notification_config import NotificationConfig
+from configurations.notification_config import NotificationConfig, ATTR_NAMESPACES
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -27,6 +31,9 @@ def setup_logging(debug: bool = False) -> None:
     logger.setLevel(level)
 
 class TorznabMonitor:
+    # Maximum number of seen entries kept per mapping
+    SEEN_LIMIT = 200
+
     def __init__(self, config_path: str = "config.json", mapping_path: str = "notification_mapping.json", skip_init: bool = False):
         # Check for required config files
         config_file = Path(config_path)
@@ -48,7 +55,16 @@ class TorznabMonitor:
             raise ValueError("Invalid Torznab configuration")
             
         self._ensure_data_directory()
-        self.scheduler = BackgroundScheduler()
+        # Seen entries are read from disk once, the seen file then only serves crash recovery
+        self._seen_cache: Dict[str, Set[int]] = {}
+        self._seen_line_counts: Dict[str, int] = {}
+        # Cache validators per feed URL for conditional requests
+        self._etags: Dict[str, str] = {}
+        self._last_modified: Dict[str, str] = {}
+        # Polls of all endpoints run one after another on the main thread, sleeping until
+        # the next one is due; the feed and Notifiarr timeouts bound how long one can block
+        self._stop_event = threading.Event()
+        self.scheduler = sched.scheduler(monotonic, self._wait)
         
         # Configure requests session with retry logic
         self.session = requests.Session()
@@ -58,27 +74,36 @@ class TorznabMonitor:
             status_forcelist=[500, 502, 503, 504],  # HTTP status codes to retry on
             allowed_methods=["GET"]  # only retry on GET requests
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry_strategy)
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
+        # Feeds compress well, ask for it explicitly
+        self.session.headers.update({'Accept-Encoding': 'gzip, deflate'})
         
         self.notification_service = NotifiarrService(
             api_key=self.config["notifiarr"]["api_key"],
             channel_id=self.config["notifiarr"]["discord"]["channel_id"],
-            webhook_url=self.config["notifiarr"]["url"]
+            webhook_url=self.config["notifiarr"]["url"],
+            template_path=self.config["notifiarr"].get("template")
         )
         self.notification_config = NotificationConfig(str(mapping_file))
         self.skip_init = skip_init
         
+        # Qualified <attr> tags, matched by lxml without namespace wildcards
+        self._attr_tags = tuple(f"{{{namespace}}}attr" for namespace in ATTR_NAMESPACES.values())
+        # Precompiled XPath expressions reused for every item of every poll
+        self._guid_xpath = ET.XPath('guid/text()', smart_strings=False)
+        self._title_xpath = ET.XPath('title/text()', smart_strings=False)
+        
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from JSON file."""
         try:
-            with open(config_path, 'r') as f:
-                return json.load(f)
+            with open(config_path, 'rb') as f:
+                return orjson.loads(f.read())
         except FileNotFoundError:
             logger.error(f"Configuration file not found: {config_path}")
             raise
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             logger.error(f"Invalid JSON in configuration file: {config_path}")
             raise
 
@@ -89,44 +114,116 @@ class TorznabMonitor:
         
     def _get_seen_file_path(self, mapping_name: str) -> Path:
         """Get the path to the seen file for a specific mapping."""
+        return Path("/data") / f"seen_{mapping_name}.log"
+
+    def _get_legacy_seen_file_path(self, mapping_name: str) -> Path:
+        """Get the path to the JSON seen file written by earlier versions."""
         return Path("/data") / f"seen_{mapping_name}.json"
+
+    def _migrate_legacy_seen(self, mapping_name: str) -> None:
+        """Convert a JSON seen file from earlier versions into the line log format."""
+        legacy_file = self._get_legacy_seen_file_path(mapping_name)
+        seen_file = self._get_seen_file_path(mapping_name)
+        if not legacy_file.exists() or seen_file.exists():
+            return
+        try:
+            with open(legacy_file, 'rb') as f:
+                guids = orjson.loads(f.read())
+            if not isinstance(guids, list):
+                logger.error(f"Seen entries for {mapping_name} in {legacy_file} are not a list, skipping migration")
+                return
+            
+            # Write to a temporary file first so a failure never leaves a partial log behind
+            tmp_file = seen_file.with_suffix('.tmp')
+            with open(tmp_file, 'w') as f:
+                f.write(''.join(f"{guid}\n" for guid in guids[-self.SEEN_LIMIT:]))
+            tmp_file.replace(seen_file)
+            legacy_file.unlink()
+            logger.info(f"Migrated seen entries for {mapping_name} to {seen_file}")
+        except (IOError, orjson.JSONDecodeError) as e:
+            logger.error(f"Failed to migrate seen entries for {mapping_name}: {e}")
+
+    def _load_seen(self, mapping_name: str) -> Set[int]:
+        """
+        Load seen entries for a specific mapping, reading the file only on first access.
+        Entries are kept in memory as hashes of the cleaned GUIDs; the hashes
+        are never persisted, so per-process hash randomization does not matter.
+        The returned set is the cached one; only _save_seen adds to it.
+        """
+        if mapping_name in self._seen_cache:
+            return self._seen_cache[mapping_name]
         
-    def _load_seen(self, mapping_name: str) -> Set[str]:
-        """Load seen entries from file for a specific mapping."""
         seen_file = self._get_seen_file_path(mapping_name)
         try:
             with open(seen_file, 'r') as f:
-                # Clean each GUID when loading
-                return {self._clean_guid(guid) for guid in json.load(f)}
-        except (FileNotFoundError, json.JSONDecodeError):
+                guids = f.read().splitlines()
+        except FileNotFoundError:
             logger.warning(f"Could not load seen entries for {mapping_name}, starting with empty set")
-            return set()
+            guids = []
+        self._seen_line_counts[mapping_name] = len(guids)
+        # Clean each GUID when loading
+        seen = {self._guid_hash(guid) for guid in guids if guid}
+        self._seen_cache[mapping_name] = seen
+        return seen
 
-    def _save_seen(self, seen: Set[str], mapping_name: str) -> None:
-        """Save seen entries to file for a specific mapping."""
+    def _save_seen(self, new_guids: List[str], mapping_name: str) -> None:
+        """
+        Record newly seen entries for a specific mapping, in memory and in the seen file.
+        The file is compacted once it grows past twice the seen items limit.
+        """
+        # Update the cache even if the file write fails, the items are notified either way
+        self._load_seen(mapping_name).update(self._guid_hash(guid) for guid in new_guids)
+        
         seen_file = self._get_seen_file_path(mapping_name)
         try:
-            # Convert set to list and limit to 200 items
-            seen_list = list(seen)
-            if len(seen_list) > 200:
-                seen_list = seen_list[-200:]  # Keep only the last 200 items
-                logger.debug(f"Seen items limit reached for {mapping_name}, keeping only the last 200 items")
+            # Append mode also creates the file when nothing new was seen
+            with open(seen_file, 'a') as f:
+                f.write(''.join(f"{guid}\n" for guid in new_guids))
             
-            with open(seen_file, 'w') as f:
-                json.dump(seen_list, f, indent=4)
+            line_count = self._seen_line_counts.get(mapping_name, 0) + len(new_guids)
+            if line_count > 2 * self.SEEN_LIMIT:
+                line_count = self._compact_seen(mapping_name)
+            self._seen_line_counts[mapping_name] = line_count
         except IOError as e:
             logger.error(f"Failed to save seen entries for {mapping_name}: {e}")
 
+    def _compact_seen(self, mapping_name: str) -> int:
+        """
+        Rewrite the seen file keeping only the most recent entries.
+        
+        Returns:
+            Number of entries left in the seen file
+        """
+        seen_file = self._get_seen_file_path(mapping_name)
+        with open(seen_file, 'r') as f:
+            guids = f.read().splitlines()[-self.SEEN_LIMIT:]
+        
+        # Write to a temporary file first so a crash never leaves a truncated log
+        tmp_file = seen_file.with_suffix('.tmp')
+        with open(tmp_file, 'w') as f:
+            f.write(''.join(f"{guid}\n" for guid in guids))
+        tmp_file.replace(seen_file)
+        
+        # Forget the dropped entries in memory as well
+        self._seen_cache[mapping_name] = {self._guid_hash(guid) for guid in guids if guid}
+        logger.debug(f"Seen items limit reached for {mapping_name}, keeping only the last {self.SEEN_LIMIT} items")
+        return len(guids)
+
     def _clear_seen(self, mapping_name: str) -> None:
         """Clear the seen items file for a specific mapping."""
         seen_file = self._get_seen_file_path(mapping_name)
         if seen_file.exists():
             logger.info(f"Clearing existing seen items file for {mapping_name}")
             seen_file.unlink()
+        self._seen_cache.pop(mapping_name, None)
+        self._seen_line_counts.pop(mapping_name, None)
 
-    def _clean_guid(self, guid: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _clean_guid(guid: str) -> str:
         """
         Clean the GUID URL by keeping only the id parameter.
+        Results are memoized since the same GUIDs are cleaned on every poll.
         
         Args:
             guid: The GUID URL to clean
@@ -135,85 +232,120 @@ class TorznabMonitor:
             Cleaned GUID URL with only id parameter
         """
         try:
-            # Split on '?' to separate base URL and parameters
-            base_url, params = guid.split('?', 1)
-            # Find the id parameter
-            for param in params.split('&'):
-                if param.startswith('id='):
-                    return f"{base_url}?{param}"
-            return base_url
-        except Exception as e:
-            logger.error(f"Failed to clean GUID: {e}")
+            parts = urlsplit(guid)
+            if not parts.query:
+                return guid
+            id_value = next((value for key, value in parse_qsl(parts.query, keep_blank_values=True) if key == 'id'), None)
+            query = urlencode({'id': id_value}) if id_value is not None else ''
+            return urlunsplit((parts.scheme, parts.netloc, parts.path, query, ''))
+        except ValueError as e:
+            logger.error("Failed to clean GUID: %s", e)
             return guid
 
-    def _extract_torznab_attr(self, item: ET.Element, attr_name: str) -> Set[str]:
+    @classmethod
+    @lru_cache(maxsize=4096)
+    def _guid_hash(cls, guid: str) -> int:
         """
-        Extract all values of a given torznab:attr name from an XML item.
+        Get the hash of a cleaned GUID as stored in the seen entries.
+        Memoized so a GUID already met in the feed or seen file costs a single cache lookup.
+        
+        Args:
+            guid: The raw GUID
+            
+        Returns:
+            Hash of the cleaned GUID
         """
-        values = set()
-        try:
-            for attr in item.findall(f".//{{*}}attr[@name='{attr_name}']"):
-                values.add(attr.attrib.get("value"))
-        except Exception as e:
-            logger.error(f"Failed to extract torznab attribute '{attr_name}': {e}")
-        return values
+        return hash(cls._clean_guid(guid))
+
+    def _get_title(self, item: ET.Element) -> str:
+        """Get the title of a Torznab item for log output."""
+        titles = self._title_xpath(item)
+        return titles[0] if titles else "No title"
 
-    def _extract_categories(self, item: ET.Element) -> Set[str]:
-        """Extract categories from Torznab item."""
-        return self._extract_torznab_attr(item, 'category')
+    def _iter_category_values(self, item: ET.Element) -> Iterator[str]:
+        """Lazily yield the category values of a Torznab item."""
+        for attr in item.iterchildren(*self._attr_tags):
+            if attr.get('name') == 'category':
+                yield attr.get('value')
 
-    def _send_notification(self, item: ET.Element, endpoint: TorznabEndpoint) -> None:
+    def _send_notifications(self, items: List[ET.Element], endpoint: TorznabEndpoint) -> None:
         """
-        Send notification for new item.
+        Send notifications for new items as a single batch.
         
         Args:
-            item: The XML item element
+            items: The XML item elements
             endpoint: The Torznab endpoint
         """
+        if not items:
+            return
         try:
             mapping_name = f"{endpoint.name}-notifiarr"
-            notification_data = self.notification_config.get_notification_data(item, mapping_name)
-            self.notification_service.send_notification(**notification_data)
+            notifications = [
+                self.notification_config.get_notification_data(item, mapping_name)
+                for item in items
+            ]
+            results = self.notification_service.send_batch(notifications)
+            failed = results.count(False)
+            if failed:
+                logger.warning(f"{failed} of {len(results)} notifications failed for {mapping_name}")
         except KeyError as e:
             logger.error(f"Notification mapping not found: {e}")
         except Exception as e:
-            logger.error(f"Failed to send notification: {e}", exc_info=True)
+            logger.error(f"Failed to send notifications: {e}", exc_info=True)
+
+    def _validate_feed_root(self, root: Optional[ET.Element], endpoint: TorznabEndpoint) -> None:
+        """
+        Check once per feed that the document is an RSS feed, so per-item
+        extraction does not need to guard against malformed documents.
+        
+        Args:
+            root: The root element of the parsed feed, None if nothing could be parsed
+            endpoint: The Torznab endpoint the feed was fetched from
+            
+        Raises:
+            ValueError: If the document is empty, a Torznab error or not an RSS feed.
+        """
+        if root is None:
+            raise ValueError(f"Empty or unparseable feed from endpoint: {endpoint.url}")
+        if root.tag == 'error':
+            raise ValueError(f"Torznab error {root.get('code')} from endpoint {endpoint.url}: {root.get('description')}")
+        if root.tag != 'rss':
+            raise ValueError(f"Unexpected root element '{root.tag}' in feed from endpoint: {endpoint.url}")
 
-    def _fetch_torznab_feed(self, endpoint: TorznabEndpoint) -> List[ET.Element]:
+    def _fetch_torznab_feed(self, endpoint: TorznabEndpoint) -> Optional[requests.Response]:
         """
-        Fetch and parse the Torznab feed for a given endpoint.
-        Returns items in reverse order (newest first) to maintain FIFO processing.
+        Request the Torznab feed for a given endpoint without reading its body.
+        The request is conditional on the ETag and Last-Modified of the last processed response,
+        which callers record with _remember_validators once the feed has been processed.
         
         Args:
             endpoint: The Torznab endpoint to fetch from
             
         Returns:
-            List of item elements from the feed in reverse order.
+            The streamed response, to be read with _iter_feed_items and closed by the caller,
+            or None if the feed has not changed since the last fetch.
             
         Raises:
             requests.RequestException: If the request fails.
-            ET.ParseError: If the XML parsing fails.
         """
         try:
-            response = self.session.get(endpoint.url, timeout=120)  # 2 minute timeout
-            response.raise_for_status()
-            root = ET.fromstring(response.content)
-            
-            # Log feed details
-            logger.info(f"Feed version: {root.tag}")
-            items = root.findall('.//item')
-            logger.info(f"Number of entries: {len(items)}")
+            headers = {}
+            if endpoint.url in self._etags:
+                headers['If-None-Match'] = self._etags[endpoint.url]
+            if endpoint.url in self._last_modified:
+                headers['If-Modified-Since'] = self._last_modified[endpoint.url]
             
-            # Log first item details for debugging
-            if items:
-                first_item = items[0]
-                logger.debug("First item details:")
-                logger.debug(f"Title: {first_item.find('title').text if first_item.find('title') is not None else 'No title'}")
-                logger.debug(f"Link: {first_item.find('link').text if first_item.find('link') is not None else 'No link'}")
-                logger.debug(f"Categories: {list(self._extract_categories(first_item))}")
-            
-            # Return items in reverse order (newest first)
-            return list(reversed(items))
+            response = self.session.get(endpoint.url, headers=headers, stream=True, timeout=120)  # 2 minute timeout
+            if response.status_code == 304:
+                response.close()
+                logger.info(f"Feed not modified since last fetch for endpoint: {endpoint.url}")
+                return None
+            try:
+                response.raise_for_status()
+            except requests.HTTPError:
+                response.close()
+                raise
+            return response
         except requests.Timeout:
             logger.error(f"Request timed out after 2 minutes for endpoint: {endpoint.url}")
             raise
@@ -221,46 +353,131 @@ class TorznabMonitor:
             logger.error(f"Request failed for endpoint {endpoint.url}: {e}")
             raise
 
-    def _process_items(self, items: List[ET.Element], categories: Set[str], mapping_name: str) -> List[ET.Element]:
+    def _remember_validators(self, endpoint: TorznabEndpoint, response: requests.Response) -> None:
+        """
+        Record the ETag and Last-Modified of a fully processed feed response,
+        so later fetches can be skipped while the feed stays unchanged.
+        
+        Args:
+            endpoint: The Torznab endpoint the feed was fetched from
+            response: The processed feed response
+        """
+        if 'ETag' in response.headers:
+            self._etags[endpoint.url] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            self._last_modified[endpoint.url] = response.headers['Last-Modified']
+
+    def _iter_feed_items(self, response: requests.Response, endpoint: TorznabEndpoint) -> Iterator[ET.Element]:
+        """
+        Parse a streamed Torznab feed, yielding items in document order (newest first).
+        Each item is cleared once the consumer moves on to the next one, so only
+        one item is held in memory at a time.
+        
+        The document root is validated before the first item is yielded (or at the
+        end for a feed without items). Validation, parse and read errors are raised
+        from the iteration, so consumers must not record seen entries or cache
+        validators until it has completed; _process_items and poll_torznab only do
+        so afterwards, leaving both untouched when a feed fails partway through.
+        
+        Args:
+            response: The streamed feed response
+            endpoint: The Torznab endpoint the feed was fetched from
+            
+        Yields:
+            Item elements, only valid until the next item is requested.
+            
+        Raises:
+            ET.XMLSyntaxError: If the XML parsing fails.
+            ValueError: If the response is not a Torznab RSS feed.
+        """
+        # Let urllib3 undo the gzip/deflate content encoding while reading
+        response.raw.decode_content = True
+        context = ET.iterparse(response.raw, events=('end',), tag='item', huge_tree=False, recover=True)
+        count = 0
+        
+        for _, item in context:
+            if count == 0:
+                # Reject non-feed documents before any item is processed
+                self._validate_feed_root(item.getroottree().getroot(), endpoint)
+            if count == 0 and logger.isEnabledFor(logging.DEBUG):
+                # Log first item details for debugging
+                link = item.find('link')
+                logger.debug("First item details:")
+                logger.debug("Title: %s", self._get_title(item))
+                logger.debug("Link: %s", link.text if link is not None else 'No link')
+                logger.debug("Categories: %s", list(self._iter_category_values(item)))
+            count += 1
+            
+            yield item
+            
+            # Release the processed item and everything parsed before it
+            item.clear(keep_tail=True)
+            while item.getprevious() is not None:
+                del item.getparent()[0]
+        
+        if count == 0:
+            self._validate_feed_root(context.root, endpoint)
+        
+        # Log feed details
+        logger.info(f"Feed version: {context.root.tag}")
+        logger.info(f"Number of entries: {count}")
+
+    def _process_items(self, items: Iterable[ET.Element], categories: Set[str], mapping_name: str) -> List[ET.Element]:
         """
-        Process a list of Torznab items, filtering by category and tracking seen items.
+        Process Torznab items in feed order (newest first), filtering by category and tracking seen items.
         Seen items are saved immediately after processing.
         
         Args:
-            items: List of XML item elements to process
+            items: XML item elements to process, possibly cleared once the next one is read
             categories: Set of categories to filter by
             mapping_name: Name of the mapping for seen items tracking
             
         Returns:
-            List of matching items that need notifications
+            List of copies of the matching items that need notifications, oldest first
         """
         seen = self._load_seen(mapping_name)
+        # Kept apart from the seen cache until the whole feed has been processed,
+        # so a failure partway through leaves the seen entries untouched
+        new_hashes = set()
+        new_guids = []
         matching_items = []
+        category_filter = frozenset(categories)
+        # Titles are only needed for log output, so skip the lookup when DEBUG is off.
+        # Messages use lazy %-formatting so disabled levels cost no string building.
+        debug = logger.isEnabledFor(logging.DEBUG)
         
         for item in items:
-            guid = item.find('guid').text if item.find('guid') is not None else None
-            title = item.find('title').text if item.find('title') is not None else "No title"
+            guids = self._guid_xpath(item)
+            guid = guids[0] if guids else None
             
             if not guid:
-                logger.debug(f"Skipping item '{title}' - no GUID")
+                if debug:
+                    logger.debug("Skipping item '%s' - no GUID", self._get_title(item))
                 continue
 
-            # Clean the GUID before checking
-            cleaned_guid = self._clean_guid(guid)
-            if cleaned_guid in seen:
-                logger.debug(f"Skipping item '{title}' - already seen")
+            # Compare the hash of the cleaned GUID
+            guid_hash = self._guid_hash(guid)
+            if guid_hash in seen or guid_hash in new_hashes:
+                if debug:
+                    logger.debug("Skipping item '%s' - already seen", self._get_title(item))
                 continue
 
-            item_categories = self._extract_categories(item)
-            if categories & item_categories:
-                logger.info(f"Found matching categories for item '{title}'")
-                matching_items.append(item)
-                seen.add(cleaned_guid)
-            else:
-                logger.debug(f"No matching categories for item '{title}'")
+            # Stops at the first matching category
+            if any(value in category_filter for value in self._iter_category_values(item)):
+                logger.info("Found matching categories for item '%s'", self._get_title(item))
+                # Streamed items are cleared after processing, keep a copy for the notification
+                matching_items.append(copy.deepcopy(item))
+                new_hashes.add(guid_hash)
+                new_guids.append(self._clean_guid(guid))
+            elif debug:
+                logger.debug("No matching categories for item '%s'", self._get_title(item))
+        
+        # Return and record items oldest first to maintain FIFO processing
+        matching_items.reverse()
+        new_guids.reverse()
         
-        # Save seen items after processing
-        self._save_seen(seen, mapping_name)
+        # Save newly seen items after processing
+        self._save_seen(new_guids, mapping_name)
         return matching_items
 
     def poll_torznab(self, endpoint: TorznabEndpoint) -> None:
@@ -274,14 +491,18 @@ class TorznabMonitor:
         mapping_name = f"{endpoint.name}-notifiarr"
         
         try:
-            items = self._fetch_torznab_feed(endpoint)
+            response = self._fetch_torznab_feed(endpoint)
+            if response is None:
+                return
             
-            # Process items (already in reverse order)
-            matching_items = self._process_items(items, endpoint.categories, mapping_name)
+            # Items are processed while the feed is being parsed
+            with response:
+                items = self._iter_feed_items(response, endpoint)
+                matching_items = self._process_items(items, endpoint.categories, mapping_name)
+            self._remember_validators(endpoint, response)
             
             # Send notifications for matching items
-            for item in matching_items:
-                self._send_notification(item, endpoint)
+            self._send_notifications(matching_items, endpoint)
             
             logger.info(f"Processed feed for {mapping_name}")
         except Exception as e:
@@ -306,20 +527,77 @@ class TorznabMonitor:
                 return
 
             logger.info(f"Creating new seen items file for {mapping_name}")
-            items = self._fetch_torznab_feed(endpoint)
+            response = self._fetch_torznab_feed(endpoint)
             
             # Process items without sending notifications
-            matching_items = self._process_items(items, endpoint.categories, mapping_name)
+            if response is None:
+                # Feed unchanged, still create the seen items file
+                matching_items = self._process_items([], endpoint.categories, mapping_name)
+            else:
+                with response:
+                    items = self._iter_feed_items(response, endpoint)
+                    matching_items = self._process_items(items, endpoint.categories, mapping_name)
+                self._remember_validators(endpoint, response)
             
             logger.info(f"Initialized seen items for {mapping_name}: {len(matching_items)} items.")
         except Exception as e:
             logger.error(f"Failed to initialize seen items: {e}", exc_info=True)
 
+    def _wait(self, delay: float) -> None:
+        """
+        Sleep until the next poll is due, waking up early when stop() is called.
+        
+        Args:
+            delay: Seconds until the next poll is due.
+        """
+        if self._stop_event.wait(delay):
+            # Drop any poll queued while stop() was running so the scheduler returns
+            self._cancel_polls()
+
+    def _cancel_polls(self) -> None:
+        """Cancel all queued polls."""
+        for event in self.scheduler.queue:
+            try:
+                self.scheduler.cancel(event)
+            except ValueError:
+                # Already started or cancelled
+                pass
+
+    def _schedule_poll(self, endpoint: TorznabEndpoint, run_at: float) -> None:
+        """
+        Schedule a poll of an endpoint.
+        
+        Args:
+            endpoint: The Torznab endpoint to poll.
+            run_at: Monotonic time at which the poll is due.
+        """
+        self.scheduler.enterabs(run_at, 1, self._run_scheduled_poll, argument=(endpoint, run_at))
+
+    def _run_scheduled_poll(self, endpoint: TorznabEndpoint, run_at: float) -> None:
+        """
+        Poll an endpoint and schedule its next poll at a fixed interval.
+        
+        Args:
+            endpoint: The Torznab endpoint to poll.
+            run_at: Monotonic time at which this poll was due.
+        """
+        self.poll_torznab(endpoint)
+        if self._stop_event.is_set():
+            return
+        # Keep a fixed rate, but skip missed runs if a poll took longer than the interval
+        self._schedule_poll(endpoint, max(run_at + endpoint.poll_interval, monotonic()))
+
     def start(self) -> None:
-        """Start the Torznab monitor for all configured endpoints."""
+        """
+        Start the Torznab monitor for all configured endpoints.
+        Blocks until stop() is called from another thread or the process is interrupted.
+        """
 
         endpointDict = self.torznab_config.endpoints
         
+        for endpoint in endpointDict.values():
+            self._migrate_legacy_seen(f"{endpoint.name}-notifiarr")
+        
         # Initialize or poll based on seen files existence
         if not self.skip_init:
             for endpointKey in endpointDict:
@@ -336,24 +614,23 @@ class TorznabMonitor:
         else:
             logger.info("Skipping initialization and polling")
         
-        # Start the scheduler for each endpoint
+        # Schedule the first poll of each endpoint one interval from now
+        now = monotonic()
         for endpointKey in endpointDict:
             endpoint = endpointDict[endpointKey]
-            self.scheduler.add_job(
-                self.poll_torznab,
-                "interval",
-                seconds=endpoint.poll_interval,
-                args=[endpoint],
-                id=f"poll_{endpointKey}"
-            )
+            self._schedule_poll(endpoint, now + endpoint.poll_interval)
             logger.info(f"Added polling job for endpoint: {endpoint.name} (interval: {endpoint.poll_interval}s)")
         
-        self.scheduler.start()
         logger.info("Torznab Monitor started. Press Ctrl+C to exit.")
+        self.scheduler.run()
 
     def stop(self) -> None:
-        """Stop the Torznab monitor."""
-        self.scheduler.shutdown()
+        """
+        Stop the Torznab monitor.
+        A poll already running finishes first, no further polls are scheduled.
+        """
+        self._stop_event.set()
+        self._cancel_polls()
         logger.info("Torznab Monitor stopped.")
 
 def parse_args() -> argparse.Namespace:
@@ -392,8 +669,6 @@ def main():
     )
     try:
         monitor.start()
-        while True:
-            sleep(1)
     except KeyboardInterrupt:
         monitor.stop()
 
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 class NotificationService(ABC):
     """Base class for notification services."""
@@ -18,4 +18,16 @@ class NotificationService(ABC):
         Returns:
             bool: True if notification was sent successfully, False otherwise
         """
-        pass 
\ No newline at end of file
+        pass 
+
+    def send_batch(self, notifications: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Send several notifications one after another, preserving their order.
+        
+        Args:
+            notifications: Keyword arguments for send_notification, one dict per notification
+            
+        Returns:
+            List[bool]: Result of each notification, in the same order
+        """
+        return [self.send_notification(**notification) for notification in notifications]
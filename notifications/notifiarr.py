@@ -1,9 +1,11 @@
 import requests
 import logging
-import json
+import orjson
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 from jinja2 import Environment, FileSystemLoader
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from .base import NotificationService
 
 logger = logging.getLogger(__name__)
@@ -11,7 +13,16 @@ logger = logging.getLogger(__name__)
 class NotifiarrService(NotificationService):
     """Notifiarr notification service implementation."""
     
-    def __init__(self, api_key: str, channel_id: int, webhook_url: str = "https://notifiarr.com/api/v1/notification/passthrough"):
+    # Seconds to wait for Notifiarr to connect or respond
+    REQUEST_TIMEOUT = 30
+    
+    def __init__(
+        self,
+        api_key: str,
+        channel_id: int,
+        webhook_url: str = "https://notifiarr.com/api/v1/notification/passthrough",
+        template_path: Optional[str] = None
+    ):
         """
         Initialize Notifiarr service.
         
@@ -19,15 +30,101 @@ class NotifiarrService(NotificationService):
             api_key: Notifiarr API key
             channel_id: Discord channel ID to send notifications to
             webhook_url: Notifiarr webhook URL
+            template_path: Optional Jinja2 template used instead of the built-in payload
         """
         self.api_key = api_key
-        self.channel_id = channel_id
+        # The template rendered the channel ID unquoted, keep sending it as a JSON number
+        self.channel_id = int(channel_id)
         self.webhook_url = f"{webhook_url}/{api_key}"
         
-        # Set up Jinja2 environment
-        template_dir = Path(__file__).parent / 'templates'
-        self.env = Environment(loader=FileSystemLoader(template_dir))
-        self.template = self.env.get_template('notifiarr.json.j2')
+        # Keep the connection to Notifiarr alive between notifications
+        self.session = requests.Session()
+        retry_strategy = Retry(
+            total=3,
+            read=0,  # the request may have been accepted, retrying could post it twice
+            backoff_factor=0.2,
+            status_forcelist=[429, 503],  # Notifiarr refused the notification, gateway errors may follow delivery
+            allowed_methods=["POST"],
+            respect_retry_after_header=False  # a long Retry-After would stall all polling
+        )
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry_strategy)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Only user-provided templates go through Jinja2, the default payload is built directly
+        self.template = None
+        if template_path:
+            template_file = Path(template_path)
+            self.env = Environment(
+                loader=FileSystemLoader(template_file.parent),
+                auto_reload=False,
+                cache_size=400
+            )
+            self.template = self.env.get_template(template_file.name)
+        
+    @staticmethod
+    def _text(value: Any, default: str = "") -> str:
+        """Render a payload text value, falling back to the default when unset."""
+        return default if value is None else str(value)
+    
+    @staticmethod
+    def _int(value: Any) -> int:
+        """Render a payload integer value, falling back to 0 when unset or invalid."""
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return 0
+        
+    def _build_payload(self, template_vars: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Build the Notifiarr passthrough payload.
+        Mirrors templates/notifiarr.json.j2 without rendering and re-parsing JSON.
+        
+        Args:
+            template_vars: Notification values keyed like the template variables
+            
+        Returns:
+            The payload ready to be sent as JSON
+        """
+        text = {
+            "title": self._text(template_vars["title"]),
+            "icon": self._text(template_vars["icon"]),
+            "content": self._text(template_vars["content"], "Content"),
+            "description": self._text(template_vars["description"])
+        }
+        if template_vars["fields"]:
+            text["fields"] = [
+                {
+                    "title": self._text(field.get("title")),
+                    "text": self._text(field.get("text")),
+                    "inline": bool(field.get("inline", False))
+                }
+                for field in template_vars["fields"]
+            ]
+        text["footer"] = self._text(template_vars["footer"])
+        
+        return {
+            "notification": {
+                "update": False,
+                "name": self._text(template_vars["name"], "Torznab-Monitor Notification"),
+                "event": self._text(template_vars["event"])
+            },
+            "discord": {
+                "color": self._text(template_vars["color"], "00FF00"),
+                "ping": {
+                    "pingUser": self._int(template_vars["ping_user"]),
+                    "pingRole": self._int(template_vars["ping_role"])
+                },
+                "images": {
+                    "thumbnail": self._text(template_vars["thumbnail"]),
+                    "image": self._text(template_vars["image"])
+                },
+                "text": text,
+                "ids": {
+                    "channel": template_vars["channel_id"]
+                }
+            }
+        }
         
     def send_notification(
         self,
@@ -83,16 +180,26 @@ class NotifiarrService(NotificationService):
             "footer": footer
         }
         
-        # Render template and send notification
+        # Build payload and send notification
         try:
-            payload = self.template.render(**template_vars)
-            logger.debug(f"Notification payload: {payload}")
+            if self.template is not None:
+                payload = orjson.loads(self.template.render(**template_vars))
+            else:
+                payload = self._build_payload(template_vars)
+            body = orjson.dumps(payload)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Notification payload: %s", body.decode())
             
             # Send notification
-            response = requests.post(self.webhook_url, json=json.loads(payload))
+            response = self.session.post(
+                self.webhook_url,
+                data=body,
+                headers={'Content-Type': 'application/json'},
+                timeout=self.REQUEST_TIMEOUT
+            )
             response.raise_for_status()
-            logger.info(f"Sent notification: {title}")
+            logger.info("Sent notification: %s", title)
             return True
         except Exception as e:
-            logger.error(f"Failed to send notification: {e}")
-            return False 
\ No newline at end of file
+            logger.error("Failed to send notification: %s", e)
+            return False